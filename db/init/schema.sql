@@ -25,7 +25,10 @@ CREATE TABLE IF NOT EXISTS public.expenses (
     )
 );
 
-CREATE INDEX IF NOT EXISTS ix_expenses_ts ON public.expenses (expense_ts);
+CREATE INDEX IF NOT EXISTS ix_expenses_ts_covering ON public.expenses (expense_ts)
+    INCLUDE (amount, method, tag, category, installments);
+CREATE INDEX IF NOT EXISTS ix_expenses_ts_installments ON public.expenses (expense_ts)
+    INCLUDE (id, amount, installments) WHERE installments > 1;
 CREATE INDEX IF NOT EXISTS ix_expenses_method ON public.expenses (method);
 CREATE INDEX IF NOT EXISTS ix_expenses_tag ON public.expenses (tag);
 CREATE INDEX IF NOT EXISTS ix_expenses_category ON public.expenses (category);
@@ -8,7 +8,13 @@ It registers all command handlers and message handlers for expense tracking.
 import logging
 
 from telegram import Update
-from telegram.ext import ApplicationBuilder, CommandHandler, MessageHandler, filters
+from telegram.ext import (
+    AIORateLimiter,
+    ApplicationBuilder,
+    CommandHandler,
+    MessageHandler,
+    filters,
+)
 
 from src.core import config
 from src.bot_service import handlers
@@ -18,6 +24,29 @@ logging.basicConfig(
 )
 log = logging.getLogger(__name__)
 
+_COMMAND_HANDLERS = (
+    ("help", handlers.cmd_help),
+    ("health", handlers.cmd_health),
+    ("last", handlers.cmd_last),
+    ("undo", handlers.cmd_undo),
+    ("balance", handlers.cmd_balance),
+)
+
+_TEXT_FILTER = filters.TEXT & (~filters.COMMAND)
+
+
+async def _post_shutdown(app) -> None:
+    """
+    Releases shared resources when the bot application shuts down.
+
+    Closes the repository connection pool so pooled database connections
+    are not left open after polling stops.
+
+    Args:
+        app: The telegram application instance being shut down.
+    """
+    await handlers.repo.close()
+
 
 def main():
     """
@@ -42,15 +71,19 @@ def main():
         return
 
     log.info("Starting bot...")
-    app = ApplicationBuilder().token(config.TELEGRAM_BOT_TOKEN).build()
-
-    app.add_handler(CommandHandler("help", handlers.cmd_help))
-    app.add_handler(CommandHandler("health", handlers.cmd_health))
-    app.add_handler(CommandHandler("last", handlers.cmd_last))
-    app.add_handler(CommandHandler("undo", handlers.cmd_undo))
-    app.add_handler(CommandHandler("balance", handlers.cmd_balance))
-
-    app.add_handler(MessageHandler(filters.TEXT & (~filters.COMMAND), handlers.on_text))
+    app = (
+        ApplicationBuilder()
+        .token(config.TELEGRAM_BOT_TOKEN)
+        .concurrent_updates(True)
+        .rate_limiter(AIORateLimiter())
+        .post_shutdown(_post_shutdown)
+        .build()
+    )
+
+    for command, callback in _COMMAND_HANDLERS:
+        app.add_handler(CommandHandler(command, callback))
+
+    app.add_handler(MessageHandler(_TEXT_FILTER, handlers.on_text))
     app.add_error_handler(handlers.on_error)
 
     log.info("Bot started and polling for messages.")
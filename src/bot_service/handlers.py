@@ -8,8 +8,8 @@ the database repository to manage expense records.
 All handlers require user authorization via ensure_auth() before processing.
 """
 
+import asyncio
 import logging
-import traceback
 from datetime import date
 from typing import TYPE_CHECKING
 
@@ -27,11 +27,102 @@ if TYPE_CHECKING:
 log = logging.getLogger(__name__)
 repo = ExpenseRepository()
 
+_HELP_TEXT = (
+    "<b>Como lançar um gasto?</b>\n"
+    "Use 5 ou 6 partes, nesta ordem, separadas por '-', ';', '|' ou ',':\n"
+    "<b>Valor - Descrição - Método - Tag - Categoria [- Parcelas]</b>\n\n"
+    "• Valor: número em BRL (ex.: 35,50)\n"
+    "• Descrição: texto livre\n"
+    "• Método: {Pix | Cartão de Crédito | Cartão de Débito | Boleto}\n"
+    "• Tag: {Gastos Pessoais | Gastos do Casal | Gastos de Casa}\n"
+    f"• Categoria: {{{' | '.join(config.CATEGORIES_DISPLAY)}}}\n"
+    "• Parcelas (opcional): número inteiro (ex.: 3)\n\n"
+    "<b>📝 Valores Negativos (Reembolsos/Estornos)</b>\n"
+    "Use valores negativos para registrar reembolsos ou estornos:\n"
+    "• Formato: <code>-150,50 - Estorno Uber - Pix - Gastos Pessoais - Transporte</code>\n"
+    "• Valores negativos reduzem o total gasto\n"
+    "• ⚠️ Valores negativos NÃO podem ter parcelamento (apenas 1x)\n\n"
+    "<b>Comandos:</b>\n"
+    "/last: Mostra os 5 últimos lançamentos\n"
+    "/undo: Apaga o último lançamento\n"
+    "/health: Testa a conexão com o banco\n"
+    "/balance: Total gasto no ciclo atual (mês e período)\n"
+    "/help: Exibe esta ajuda"
+)
+
+_ESCAPED_MD2 = {
+    value: utils.escape_markdown_v2(value)
+    for value in (
+        *config.ALLOWED_METHODS.values(),
+        *config.ALLOWED_TAGS.values(),
+        *config.CATEGORIES_DISPLAY,
+    )
+}
+
+_CONFIRM_LABELS = {
+    name: f"{name:<11}: "
+    for name in ("ID", "Valor", "Descrição", "Tag", "Categoria", "Método", "Parcelas")
+}
+
+_ALLOWED_USER_ID = config.ALLOWED_USER_ID
+_AUTH_CONFIGURED = _ALLOWED_USER_ID is not None and _ALLOWED_USER_ID > 0
+
+_pending_replies: set[asyncio.Task] = set()
+
+
+def _on_reply_done(task: asyncio.Task) -> None:
+    """
+    Releases a finished background reply task and logs any send failure.
+
+    Args:
+        task: The completed reply task.
+    """
+    _pending_replies.discard(task)
+    if not task.cancelled() and task.exception() is not None:
+        log.error("Failed to send rejection reply", exc_info=task.exception())
+
+
+def _reply_in_background(coro) -> None:
+    """
+    Schedules a reply coroutine without awaiting it, keeping a strong reference.
+
+    The event loop only holds weak references to tasks, so the task is stored
+    in a module-level set until it completes; its outcome is checked in a done
+    callback so send errors are logged instead of silently dropped.
 
-async def ensure_auth(update: Update) -> bool:
+    Args:
+        coro: The reply coroutine to run in the background.
+    """
+    task = asyncio.create_task(coro)
+    _pending_replies.add(task)
+    task.add_done_callback(_on_reply_done)
+
+
+_MONTHS_PT = (
+    "",
+    "Janeiro",
+    "Fevereiro",
+    "Março",
+    "Abril",
+    "Maio",
+    "Junho",
+    "Julho",
+    "Agosto",
+    "Setembro",
+    "Outubro",
+    "Novembro",
+    "Dezembro",
+)
+
+
+def ensure_auth(update: Update) -> bool:
     """
     Checks if the user is authorized to use the bot.
 
+    The authorized path is a plain synchronous comparison so handlers pay no
+    coroutine overhead per message; rejection replies are scheduled as
+    fire-and-forget tasks on the running event loop.
+
     Args:
         update: The Telegram update object containing user information.
 
@@ -41,21 +132,24 @@ async def ensure_auth(update: Update) -> bool:
     Raises:
         None - sends rejection message to unauthorized users.
     """
-    uid = update.effective_user.id if update.effective_user else None
+    user = update.effective_user
+    if _AUTH_CONFIGURED and user is not None and user.id == _ALLOWED_USER_ID:
+        return True
 
-    if config.ALLOWED_USER_ID is None or config.ALLOWED_USER_ID <= 0:
+    if not _AUTH_CONFIGURED:
         log.error("ALLOWED_USER_ID not configured properly. Denying all access.")
         if update.message:
-            await update.message.reply_text("Bot não configurado corretamente.")
-        return False
-
-    if uid is None or uid != config.ALLOWED_USER_ID:
-        log.warning(f"Unauthorized access attempt from user ID: {uid}")
-        if update.message:
-            await update.message.reply_text("Usuário não autorizado.")
+            _reply_in_background(
+                update.message.reply_text("Bot não configurado corretamente.")
+            )
         return False
 
-    return True
+    log.warning(
+        "Unauthorized access attempt from user ID: %s", user.id if user else None
+    )
+    if update.message:
+        _reply_in_background(update.message.reply_text("Usuário não autorizado."))
+    return False
 
 
 async def cmd_help(update: Update, context: ContextTypes.DEFAULT_TYPE):
@@ -72,33 +166,10 @@ async def cmd_help(update: Update, context: ContextTypes.DEFAULT_TYPE):
     Returns:
         None
     """
-    if not await ensure_auth(update):
+    if not ensure_auth(update):
         return
 
-    categories_text = " | ".join(config.CATEGORIES_DISPLAY)
-    help_text = (
-        "<b>Como lançar um gasto?</b>\n"
-        "Use 5 ou 6 partes, nesta ordem, separadas por '-', ';', '|' ou ',':\n"
-        "<b>Valor - Descrição - Método - Tag - Categoria [- Parcelas]</b>\n\n"
-        "• Valor: número em BRL (ex.: 35,50)\n"
-        "• Descrição: texto livre\n"
-        "• Método: {Pix | Cartão de Crédito | Cartão de Débito | Boleto}\n"
-        "• Tag: {Gastos Pessoais | Gastos do Casal | Gastos de Casa}\n"
-        f"• Categoria: {{{categories_text}}}\n"
-        "• Parcelas (opcional): número inteiro (ex.: 3)\n\n"
-        "<b>📝 Valores Negativos (Reembolsos/Estornos)</b>\n"
-        "Use valores negativos para registrar reembolsos ou estornos:\n"
-        "• Formato: <code>-150,50 - Estorno Uber - Pix - Gastos Pessoais - Transporte</code>\n"
-        "• Valores negativos reduzem o total gasto\n"
-        "• ⚠️ Valores negativos NÃO podem ter parcelamento (apenas 1x)\n\n"
-        "<b>Comandos:</b>\n"
-        "/last: Mostra os 5 últimos lançamentos\n"
-        "/undo: Apaga o último lançamento\n"
-        "/health: Testa a conexão com o banco\n"
-        "/balance: Total gasto no ciclo atual (mês e período)\n"
-        "/help: Exibe esta ajuda"
-    )
-    await update.message.reply_text(help_text, parse_mode="HTML")
+    await update.message.reply_text(_HELP_TEXT, parse_mode="HTML")
 
 
 async def cmd_health(update: Update, context: ContextTypes.DEFAULT_TYPE):
@@ -114,7 +185,7 @@ async def cmd_health(update: Update, context: ContextTypes.DEFAULT_TYPE):
     Returns:
         None
     """
-    if not await ensure_auth(update):
+    if not ensure_auth(update):
         return
 
     if await repo.check_connection():
@@ -136,7 +207,7 @@ async def cmd_undo(update: Update, context: ContextTypes.DEFAULT_TYPE):
     Returns:
         None
     """
-    if not await ensure_auth(update):
+    if not ensure_auth(update):
         return
 
     deleted_id = await repo.delete_last_expense()
@@ -160,7 +231,7 @@ async def cmd_last(update: Update, context: ContextTypes.DEFAULT_TYPE):
     Returns:
         None
     """
-    if not await ensure_auth(update):
+    if not ensure_auth(update):
         return
 
     expenses = await repo.get_last_n_expenses(limit=5)
@@ -168,31 +239,26 @@ async def cmd_last(update: Update, context: ContextTypes.DEFAULT_TYPE):
         await update.message.reply_text("Nenhum lançamento encontrado.")
         return
 
-    headers = ["Data", "Valor", "Descrição"]
-
-    col_widths = {h: len(h) for h in headers}
-    table_data = []
-
-    for exp in expenses:
-        row = {
-            "Data": exp.expense_ts.strftime("%d/%m/%Y %H:%M"),
-            "Valor": utils.brl(exp.amount),
-            "Descrição": exp.description,
-        }
-        table_data.append(row)
+    dates = [exp.expense_ts.strftime("%d/%m/%Y %H:%M") for exp in expenses]
+    values = [utils.brl(exp.amount) for exp in expenses]
+    descriptions = [exp.description for exp in expenses]
 
-        for header in headers:
-            col_widths[header] = max(col_widths[header], len(row[header]))
+    w_date = max(len("Data"), max(map(len, dates)))
+    w_value = max(len("Valor"), max(map(len, values)))
+    w_desc = max(len("Descrição"), max(map(len, descriptions)))
 
-    header_line = " | ".join(h.ljust(col_widths[h]) for h in headers)
-    separator_line = "-+-".join("-" * col_widths[h] for h in headers)
+    row_fmt = f"{{:<{w_date}}} | {{:<{w_value}}} | {{:<{w_desc}}}"
 
-    row_lines = []
-    for row in table_data:
-        row_line = " | ".join(row[h].ljust(col_widths[h]) for h in headers)
-        row_lines.append(row_line)
+    lines = [
+        row_fmt.format("Data", "Valor", "Descrição"),
+        "-+-".join(("-" * w_date, "-" * w_value, "-" * w_desc)),
+    ]
+    lines.extend(
+        row_fmt.format(date_s, value_s, desc)
+        for date_s, value_s, desc in zip(dates, values, descriptions)
+    )
 
-    final_table = "\n".join([header_line, separator_line] + row_lines)
+    final_table = "\n".join(lines)
 
     await update.message.reply_text(
         f"*Últimos 5 Lançamentos:*\n\n```\n{final_table}\n```", parse_mode="MarkdownV2"
@@ -219,30 +285,38 @@ async def on_text(update: Update, context: ContextTypes.DEFAULT_TYPE):
     Raises:
         ValueError: If the message format is invalid or contains disallowed values.
     """
-    if not await ensure_auth(update) or not update.message or not update.message.text:
+    if not ensure_auth(update) or not update.message or not update.message.text:
         return
 
     try:
         expense: "Expense" = parse_message(update.message.text.strip())
-        expense_id = await repo.add_expense(expense)
+        insert_task = asyncio.create_task(repo.add_expense(expense))
 
         safe_description = utils.escape_markdown_v2(expense.description)
-        safe_tag = utils.escape_markdown_v2(expense.tag)
-        safe_category = utils.escape_markdown_v2(expense.category)
-        safe_method = utils.escape_markdown_v2(expense.method)
+        safe_tag = _ESCAPED_MD2.get(expense.tag) or utils.escape_markdown_v2(
+            expense.tag
+        )
+        safe_category = _ESCAPED_MD2.get(expense.category) or utils.escape_markdown_v2(
+            expense.category
+        )
+        safe_method = _ESCAPED_MD2.get(expense.method) or utils.escape_markdown_v2(
+            expense.method
+        )
 
         table_lines = [
-            f"{'ID':<11}: {expense_id}",
-            f"{'Valor':<11}: {utils.escape_markdown_v2(utils.brl(expense.amount))}",
-            f"{'Descrição':<11}: {safe_description}",
-            f"{'Tag':<11}: {safe_tag}",
-            f"{'Categoria':<11}: {safe_category}",
-            f"{'Método':<11}: {safe_method}",
+            _CONFIRM_LABELS["Valor"]
+            + utils.escape_markdown_v2(utils.brl(expense.amount)),
+            _CONFIRM_LABELS["Descrição"] + safe_description,
+            _CONFIRM_LABELS["Tag"] + safe_tag,
+            _CONFIRM_LABELS["Categoria"] + safe_category,
+            _CONFIRM_LABELS["Método"] + safe_method,
         ]
 
         if expense.installments:
-            table_lines.append(f"{'Parcelas':<11}: {expense.installments}x")
+            table_lines.append(f"{_CONFIRM_LABELS['Parcelas']}{expense.installments}x")
 
+        expense_id = await insert_task
+        table_lines.insert(0, f"{_CONFIRM_LABELS['ID']}{expense_id}")
         table_str = "\n".join(table_lines)
 
         await update.message.reply_text(
@@ -253,7 +327,7 @@ async def on_text(update: Update, context: ContextTypes.DEFAULT_TYPE):
     except ValueError as e:
         await update.message.reply_text(f"⚠️ {e}")
     except Exception as e:
-        log.error(f"An unexpected error occurred: {e}", exc_info=True)
+        log.error("An unexpected error occurred: %s", e, exc_info=True)
         await update.message.reply_text(
             "💥 Ocorreu um erro inesperado ao processar sua solicitação."
         )
@@ -276,7 +350,7 @@ async def cmd_balance(update: Update, context: ContextTypes.DEFAULT_TYPE):
     Returns:
         None
     """
-    if not await ensure_auth(update):
+    if not ensure_auth(update):
         return
 
     today = date.today()
@@ -285,23 +359,8 @@ async def cmd_balance(update: Update, context: ContextTypes.DEFAULT_TYPE):
 
     spent = await repo.get_total_spent_in_period(start, today)
 
-    months = [
-        "",
-        "Janeiro",
-        "Fevereiro",
-        "Março",
-        "Abril",
-        "Maio",
-        "Junho",
-        "Julho",
-        "Agosto",
-        "Setembro",
-        "Outubro",
-        "Novembro",
-        "Dezembro",
-    ]
     invoice_month_number = end.month
-    invoice_month_name = months[invoice_month_number]
+    invoice_month_name = _MONTHS_PT[invoice_month_number]
 
     start_s = start.strftime("%d/%m/%Y")
     end_s = end.strftime("%d/%m/%Y")
@@ -330,10 +389,7 @@ async def on_error(update: object, context: ContextTypes.DEFAULT_TYPE):
     Returns:
         None
     """
-    exc_text = "".join(
-        traceback.format_exception(None, context.error, context.error.__traceback__)
-    )
-    log.error("Unhandled exception:\n%s", exc_text)
+    log.error("Unhandled exception", exc_info=context.error)
 
     if isinstance(update, Update) and update.effective_message:
         await update.effective_message.reply_text(
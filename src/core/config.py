@@ -9,17 +9,30 @@ including database credentials, billing cycle dates, and validation rules.
 import json
 import os
 import re
+import sys
 import unicodedata
 from datetime import date
+from functools import lru_cache
 from pathlib import Path
 
 
+_ACCENT_TBL: dict[int, str] = str.maketrans(
+    "áàâãäéèêëíìîïóòôõöúùûüçÁÀÂÃÄÉÈÊËÍÌÎÏÓÒÔÕÖÚÙÛÜÇ",
+    "aaaaaeeeeiiiiooooouuuucAAAAAEEEEIIIIOOOOOUUUUC",
+)
+
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+@lru_cache(maxsize=256)
 def _strip_accents_lower(s: str) -> str:
     """
     Normalizes accents, removes extra whitespace, and lowercases a string.
 
     Used for case-insensitive and accent-insensitive matching of categories,
-    tags, and payment methods.
+    tags, and payment methods. The common Portuguese accented letters are
+    mapped through a precomputed translation table; the NFKD decomposition
+    pass only runs for inputs that still contain non-ASCII characters.
 
     Args:
         s: The input string to normalize.
@@ -27,9 +40,14 @@ def _strip_accents_lower(s: str) -> str:
     Returns:
         Normalized, lowercased string without accents.
     """
-    n = unicodedata.normalize("NFKD", s)
-    n = "".join(ch for ch in n if not unicodedata.combining(ch))
-    return re.sub(r"\s+", " ", n).strip().lower()
+    if s.isascii():
+        n = s
+    else:
+        n = s.translate(_ACCENT_TBL)
+        if not n.isascii():
+            n = unicodedata.normalize("NFKD", n)
+            n = "".join(ch for ch in n if not unicodedata.combining(ch))
+    return _WHITESPACE_RE.sub(" ", n).strip().lower()
 
 
 def _load_app_config() -> dict:
@@ -56,8 +74,6 @@ def _load_app_config() -> dict:
         return json.load(f)
 
 
-_app_config: dict = _load_app_config()
-
 POSTGRES_PASSWORD: str = os.getenv("POSTGRES_PASSWORD", "change_me")
 POSTGRES_USER: str = os.getenv("POSTGRES_USER", "finance")
 POSTGRES_DB: str = os.getenv("POSTGRES_DB", "finance")
@@ -81,39 +97,79 @@ CYCLE_RESET_DAY_NEW: int = 17
 CYCLE_CHANGE_DATE: date = date(2025, 10, 4)
 CYCLE_TRANSITION_END_DATE: date = date(2025, 11, 16)
 
-ALLOWED_METHODS: dict[str, str] = _app_config.get("methods", {})
-ALLOWED_TAGS: dict[str, str] = _app_config.get("tags", {})
-CATEGORIES_DISPLAY: list[str] = _app_config.get("categories_display", [])
+_LAZY_CONFIG_ATTRS = frozenset(
+    {"ALLOWED_METHODS", "ALLOWED_TAGS", "CATEGORIES_DISPLAY", "ALLOWED_CATEGORIES"}
+)
+
+
+def __getattr__(name: str):
+    """
+    Loads the allowed-value attributes from categories.json on first access.
+
+    The JSON file is only read (and the normalized category map built) when
+    one of the allowed-value attributes is first requested; the results are
+    then published into the module globals so later accesses are plain
+    attribute lookups. Canonical value strings are interned, making the
+    equality and hash operations on Expense fields pointer comparisons.
+
+    Args:
+        name: The requested module attribute name.
+
+    Returns:
+        The resolved attribute value.
+
+    Raises:
+        AttributeError: If the attribute is not one of the lazy config values.
+    """
+    if name in _LAZY_CONFIG_ATTRS:
+        app_config = _load_app_config()
+        categories_display: list[str] = [
+            sys.intern(cat) for cat in app_config.get("categories_display", [])
+        ]
+        values: dict[str, object] = {
+            "ALLOWED_METHODS": {
+                k: sys.intern(v) for k, v in app_config.get("methods", {}).items()
+            },
+            "ALLOWED_TAGS": {
+                k: sys.intern(v) for k, v in app_config.get("tags", {}).items()
+            },
+            "CATEGORIES_DISPLAY": categories_display,
+            "ALLOWED_CATEGORIES": {
+                _strip_accents_lower(cat): cat for cat in categories_display
+            },
+        }
+        globals().update(values)
+        return values[name]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
-ALLOWED_CATEGORIES: dict[str, str] = {
-    _strip_accents_lower(cat): cat for cat in CATEGORIES_DISPLAY
-}
 
 SEP_RE: re.Pattern[str] = re.compile(r"\s*(?:-+(?!\d)|;|\||,(?!\d))\s*")
 
-LOWER_WORDS: set[str] = {
-    "de",
-    "da",
-    "do",
-    "das",
-    "dos",
-    "e",
-    "em",
-    "no",
-    "na",
-    "nos",
-    "nas",
-    "para",
-    "por",
-    "com",
-    "ao",
-    "a",
-    "à",
-    "às",
-    "o",
-    "os",
-    "um",
-    "uma",
-    "umas",
-    "uns",
-}
+LOWER_WORDS: frozenset[str] = frozenset(
+    {
+        "de",
+        "da",
+        "do",
+        "das",
+        "dos",
+        "e",
+        "em",
+        "no",
+        "na",
+        "nos",
+        "nas",
+        "para",
+        "por",
+        "com",
+        "ao",
+        "a",
+        "à",
+        "às",
+        "o",
+        "os",
+        "um",
+        "uma",
+        "umas",
+        "uns",
+    }
+)
@@ -11,11 +11,13 @@ from decimal import Decimal
 from typing import Optional
 
 
-@dataclass
+@dataclass(slots=True)
 class Expense:
     """
     Represents a single expense record in the application.
     This class serves as a data contract between the application layers.
+    Slots keep instances compact and make attribute access a fixed-offset
+    load instead of a per-instance dict lookup.
     """
 
     amount: Decimal
@@ -24,6 +26,6 @@ class Expense:
     tag: str
     category: str
     installments: Optional[int] = None
-    id: Optional[int] = field(init=False, default=None)
-    expense_ts: Optional[datetime] = field(init=False, default=None)
+    id: Optional[int] = None
+    expense_ts: Optional[datetime] = None
     parsed: bool = field(init=False, default=True)
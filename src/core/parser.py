@@ -7,18 +7,40 @@ formatting functions for Brazilian currency and title-casing in Portuguese.
 """
 
 import re
+from dataclasses import replace
 from decimal import Decimal, InvalidOperation
+from functools import lru_cache
+from typing import Final
 
 from src.core import config
 from src.core.models import Expense
 
+_METHOD_ERROR: Final[str] = (
+    "Método inválido. Use: Pix, Cartão de Crédito, Cartão de Débito ou Boleto."
+)
+_TAG_ERROR: Final[str] = (
+    "Tag inválida. Use: Gastos Pessoais, Gastos do Casal ou Gastos de Casa."
+)
+_CATEGORY_ERROR: Final[str] = (
+    f"Categoria inválida. Use: {', '.join(config.CATEGORIES_DISPLAY)}."
+)
 
+_STRIP_ACCENTS_LOWER = config._strip_accents_lower
+_ALLOWED_METHODS: Final[dict[str, str]] = config.ALLOWED_METHODS
+_ALLOWED_TAGS: Final[dict[str, str]] = config.ALLOWED_TAGS
+_ALLOWED_CATEGORIES: Final[dict[str, str]] = config.ALLOWED_CATEGORIES
+_LOWER_WORDS: Final[frozenset[str]] = config.LOWER_WORDS
+
+
+@lru_cache(maxsize=512)
 def titleize_pt(s: str) -> str:
     """
     Converts a string to title case following Portuguese grammar rules.
 
     Common Portuguese connectives (de, da, do, e, em, etc.) are kept in lowercase
-    unless they appear as the first word.
+    unless they appear as the first word. The string is walked once by a manual
+    scanner that slices words between whitespace and dash separators, with no
+    regex or intermediate token list.
 
     Args:
         s: The input string to title-case.
@@ -26,20 +48,35 @@ def titleize_pt(s: str) -> str:
     Returns:
         Title-cased string with proper Portuguese grammar.
     """
-    words = re.split(r"(\s+|-)", s.strip().lower())
-    output, is_first = [], True
-    for token in words:
-        if not token.strip() or re.fullmatch(r"\s+|-", token):
-            output.append(token)
-            continue
-        if is_first or token not in config.LOWER_WORDS:
-            output.append(token.capitalize())
-        else:
-            output.append(token)
+    text = s.strip().lower()
+    output: list[str] = []
+    word_start: int | None = None
+    is_first = True
+
+    def flush(end: int | None) -> None:
+        nonlocal is_first
+        word = text[word_start:end]
+        if is_first or word not in _LOWER_WORDS:
+            word = word.capitalize()
+        output.append(word)
         is_first = False
+
+    for i, ch in enumerate(text):
+        if ch.isspace() or ch == "-":
+            if word_start is not None:
+                flush(i)
+                word_start = None
+            output.append(ch)
+        elif word_start is None:
+            word_start = i
+
+    if word_start is not None:
+        flush(None)
+
     return "".join(output)
 
 
+@lru_cache(maxsize=256)
 def canon_method(raw: str) -> str:
     """
     Finds and returns the canonical payment method from a raw string.
@@ -56,14 +93,13 @@ def canon_method(raw: str) -> str:
     Raises:
         ValueError: If the payment method is not recognized.
     """
-    key = config._strip_accents_lower(raw)
-    if key in config.ALLOWED_METHODS:
-        return config.ALLOWED_METHODS[key]
-    raise ValueError(
-        "Método inválido. Use: Pix, Cartão de Crédito, Cartão de Débito ou Boleto."
-    )
+    key = _STRIP_ACCENTS_LOWER(raw)
+    if key in _ALLOWED_METHODS:
+        return _ALLOWED_METHODS[key]
+    raise ValueError(_METHOD_ERROR)
 
 
+@lru_cache(maxsize=256)
 def canon_tag(raw: str) -> str:
     """
     Finds and returns the canonical tag from a raw string.
@@ -80,14 +116,13 @@ def canon_tag(raw: str) -> str:
     Raises:
         ValueError: If the tag is not recognized.
     """
-    key = config._strip_accents_lower(raw)
-    if key in config.ALLOWED_TAGS:
-        return config.ALLOWED_TAGS[key]
-    raise ValueError(
-        "Tag inválida. Use: Gastos Pessoais, Gastos do Casal ou Gastos de Casa."
-    )
+    key = _STRIP_ACCENTS_LOWER(raw)
+    if key in _ALLOWED_TAGS:
+        return _ALLOWED_TAGS[key]
+    raise ValueError(_TAG_ERROR)
 
 
+@lru_cache(maxsize=256)
 def canon_category(raw: str) -> str:
     """
     Finds and returns the canonical category from a raw string.
@@ -104,13 +139,25 @@ def canon_category(raw: str) -> str:
     Raises:
         ValueError: If the category is not recognized.
     """
-    key = config._strip_accents_lower(raw)
-    if key in config.ALLOWED_CATEGORIES:
-        return config.ALLOWED_CATEGORIES[key]
-    allowed_values = ", ".join(config.CATEGORIES_DISPLAY)
-    raise ValueError(f"Categoria inválida. Use: {allowed_values}.")
+    key = _STRIP_ACCENTS_LOWER(raw)
+    if key in _ALLOWED_CATEGORIES:
+        return _ALLOWED_CATEGORIES[key]
+    raise ValueError(_CATEGORY_ERROR)
+
 
+_BRL_AMOUNT_RE: Final[re.Pattern[str]] = re.compile(
+    r"(?:[Rr]\$\s?)?(?P<sign>-?)(?:"
+    r"(?P<grouped>\d{1,3}(?:\.\d{3})+),(?P<gfrac>\d{1,2})"
+    r"|(?P<plain>\d+)(?:[.,](?P<pfrac>\d+))?"
+    r")"
+)
+_BRL_PREFIX_RE: Final[re.Pattern[str]] = re.compile(r"[Rr]\$\s?")
+_GROUPED_BRL_RE: Final[re.Pattern[str]] = re.compile(r"\d+\.\d{3},\d{1,2}$")
+_INT_RE: Final[re.Pattern[str]] = re.compile(r"\d+")
+_CENT: Final[Decimal] = Decimal("0.01")
 
+
+@lru_cache(maxsize=512)
 def br_to_decimal(s: str) -> Decimal:
     """
     Parses Brazilian currency format strings into a Decimal.
@@ -121,6 +168,9 @@ def br_to_decimal(s: str) -> Decimal:
     - "R$ 1.234,56" (with currency symbol)
     - "35,50" (simple decimal format)
 
+    Common formats are recognized by a single precompiled regex scan;
+    unusual inputs fall back to the multi-pass normalization path.
+
     Args:
         s: The currency string to parse.
 
@@ -131,9 +181,21 @@ def br_to_decimal(s: str) -> Decimal:
         ValueError: If the string cannot be parsed as a valid currency value.
     """
     text = s.strip()
-    text = re.sub(r"[Rr]\$\s?", "", text)
 
-    if re.search(r"\d+\.\d{3},\d{1,2}$", text):
+    m = _BRL_AMOUNT_RE.fullmatch(text)
+    if m:
+        sign = m.group("sign")
+        if m.group("grouped"):
+            digits = m.group("grouped").replace(".", "")
+            text = f"{sign}{digits}.{m.group('gfrac')}"
+        elif m.group("pfrac"):
+            text = f"{sign}{m.group('plain')}.{m.group('pfrac')}"
+        else:
+            text = f"{sign}{m.group('plain')}"
+        return Decimal(text).quantize(_CENT)
+
+    text = _BRL_PREFIX_RE.sub("", text)
+    if _GROUPED_BRL_RE.search(text):
         text = text.replace(".", "").replace(",", ".")
     elif "," in text and "." not in text:
         text = text.replace(",", ".")
@@ -143,30 +205,57 @@ def br_to_decimal(s: str) -> Decimal:
     except InvalidOperation:
         raise ValueError(f"Valor inválido: '{s}'")
 
-    return value.quantize(Decimal("0.01"))
+    return value.quantize(_CENT)
+
+
+_MESSAGE_RE: Final[re.Pattern[str]] = re.compile(
+    "(?P<value>.*?){sep}(?P<description>.*?){sep}(?P<method>.*?){sep}"
+    "(?P<tag>.*?){sep}(?P<category>.*?)(?:{sep}(?P<installments>.*))?".format(
+        sep=f"(?:{config.SEP_RE.pattern})"
+    ),
+    re.DOTALL,
+)
 
 
 def parse_message(text: str) -> Expense:
     """
     Parses a raw text message into a structured Expense object.
     Format: Value - Description - Method - Tag - Category [- Installments]
+
+    Parsing is memoized on the raw text; repeated messages return a fresh
+    copy of the cached result so callers never share a mutable instance.
     """
-    parts = config.SEP_RE.split(text.strip(), maxsplit=5)
+    return replace(_parse_message_cached(text))
+
 
-    if len(parts) < 5:
+@lru_cache(maxsize=256)
+def _parse_message_cached(text: str) -> Expense:
+    """
+    Performs the actual parse behind parse_message's memoization layer.
+
+    The message is matched against a single precompiled named-group pattern
+    instead of splitting and re-assembling the parts in Python.
+    """
+    match = _MESSAGE_RE.fullmatch(text.strip())
+
+    if not match:
         raise ValueError(
             "Lançamento Incorreto: Utilize o formato: Valor - Descrição - Método - Tag - Categoria [- Parcelas]"
         )
 
-    val_s, desc_raw, method_raw, tag_raw, category_raw = parts[:5]
-    inst_raw = parts[5] if len(parts) > 5 else None
+    val_s = match.group("value")
+    desc_raw = match.group("description")
+    method_raw = match.group("method")
+    tag_raw = match.group("tag")
+    category_raw = match.group("category")
+    inst_raw = match.group("installments")
 
     if not desc_raw.strip():
         raise ValueError("A descrição não pode estar vazia.")
 
     installments = None
     if inst_raw and inst_raw.strip():
-        if not re.fullmatch(r"\d+", inst_raw.strip()):
+        if not _INT_RE.fullmatch(inst_raw.strip()):
             raise ValueError("Parcelas deve ser um número inteiro (ex.: 3).")
         installments = int(inst_raw.strip())
 
@@ -178,11 +267,15 @@ def parse_message(text: str) -> Expense:
             "Use apenas 1x ou omita o número de parcelas."
         )
 
+    method = canon_method(method_raw)
+    tag = canon_tag(tag_raw)
+    category = canon_category(category_raw)
+
     return Expense(
         amount=amount,
         description=titleize_pt(desc_raw),
-        method=canon_method(method_raw),
-        tag=canon_tag(tag_raw),
-        category=canon_category(category_raw),
+        method=method,
+        tag=tag,
+        category=category,
         installments=installments,
     )
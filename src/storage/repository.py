@@ -6,18 +6,87 @@ for all database operations related to expenses. Handles complex SQL queries wit
 recursive CTEs for installment distribution across billing cycles.
 """
 
+import asyncio
 from datetime import date
 from decimal import Decimal
 from typing import Optional, List
 import logging
 
 import psycopg
+import psycopg_pool
 
 from src.core import config
 from src.core.models import Expense
 
 log = logging.getLogger(__name__)
 
+_SQL_INSERT_EXPENSE = """
+    INSERT INTO public.expenses
+        (expense_ts, amount, description, method, tag, category, installments)
+    VALUES
+        (NOW(), %s, %s, %s, %s, %s, %s)
+    RETURNING id
+"""
+
+_SQL_TOTAL_PERIOD = """
+    WITH RECURSIVE installment_cycles AS (
+        SELECT
+            id,
+            expense_ts,
+            amount / installments AS installment_amount,
+            installments,
+            1 AS installment_number,
+            expense_ts AS current_ts
+        FROM public.expenses
+        WHERE installments > 1
+          AND (expense_ts AT TIME ZONE 'America/Sao_Paulo')::date <= %s
+          AND expense_ts + ((installments - 1) * INTERVAL '1 month') + INTERVAL '44 days' >= %s
+
+        UNION ALL
+
+        SELECT
+            ic.id,
+            ic.expense_ts,
+            ic.installment_amount,
+            ic.installments,
+            ic.installment_number + 1,
+            CASE
+                WHEN ic.current_ts::date >= DATE '2025-10-04' AND ic.current_ts::date < DATE '2025-11-17'
+                THEN DATE '2025-11-17' + (ic.current_ts::time)
+                ELSE ic.current_ts + INTERVAL '1 month'
+            END
+        FROM installment_cycles ic
+        WHERE ic.installment_number < ic.installments
+          AND (ic.current_ts AT TIME ZONE 'America/Sao_Paulo')::date <= %s
+    ),
+    monthly_expenses AS (
+        SELECT current_ts AS expense_ts, installment_amount AS amount
+        FROM installment_cycles
+
+        UNION ALL
+
+        SELECT expense_ts, amount
+        FROM public.expenses
+        WHERE (installments IS NULL OR installments <= 1)
+          AND (expense_ts AT TIME ZONE 'America/Sao_Paulo')::date BETWEEN %s AND %s
+    )
+    SELECT COALESCE(SUM(amount), 0) FROM monthly_expenses
+    WHERE (expense_ts AT TIME ZONE 'America/Sao_Paulo')::date BETWEEN %s AND %s
+"""
+
+_SQL_DELETE_LAST = """
+    DELETE FROM public.expenses
+    WHERE id = (SELECT MAX(id) FROM public.expenses)
+    RETURNING id
+"""
+
+_SQL_LAST_N = """
+    SELECT id, expense_ts, amount, description, method, tag, category, installments
+    FROM public.expenses
+    ORDER BY id DESC
+    LIMIT %s
+"""
+
 
 class ExpenseRepository:
     """
@@ -26,37 +95,64 @@ class ExpenseRepository:
     This class serves as the single source of truth for database interactions,
     providing methods to create, read, update, and delete expense records.
     Implements complex installment distribution logic across billing cycles
-    using PostgreSQL recursive CTEs. All async methods use autocommit
-    connections for simplicity.
+    using PostgreSQL recursive CTEs. All async methods acquire autocommit
+    connections from a shared connection pool, avoiding the cost of a fresh
+    TCP + authentication handshake on every query.
     """
 
     def __init__(self):
         """
-        Initializes the repository by preparing the database connection string.
+        Initializes the repository by preparing the database connection pool.
 
         The connection string is built from environment variables loaded in
-        the config module. Connection parameters include host, port, database
-        name, user, and password.
+        the config module. The pool is created closed and opened lazily on
+        first use, so importing this module never touches the network.
         """
         self.dsn = (
             f"host={config.DB_HOST} port={config.DB_PORT} "
             f"dbname={config.POSTGRES_DB} user={config.POSTGRES_USER} "
             f"password={config.POSTGRES_PASSWORD}"
         )
+        self._pool = psycopg_pool.AsyncConnectionPool(
+            self.dsn,
+            min_size=2,
+            max_size=10,
+            open=False,
+            kwargs={"autocommit": True, "connect_timeout": 10},
+        )
+        self._pool_lock: Optional[asyncio.Lock] = None
 
-    async def _get_conn(self) -> psycopg.AsyncConnection:
+    async def _acquire(self):
         """
-        Establishes an asynchronous, autocommit connection to the database.
+        Returns an async context manager yielding a pooled autocommit connection.
+
+        Opens the connection pool on first use. The returned connection is
+        handed back to the pool when the context manager exits.
 
         Returns:
-            An async database connection with autocommit enabled.
+            An async context manager yielding a psycopg.AsyncConnection.
 
         Raises:
-            psycopg.OperationalError: If connection fails or times out.
+            psycopg_pool.PoolTimeout: If no connection becomes available in time.
+            psycopg.OperationalError: If connection establishment fails.
         """
-        return await psycopg.AsyncConnection.connect(
-            self.dsn, autocommit=True, connect_timeout=10
-        )
+        if self._pool.closed:
+            if self._pool_lock is None:
+                self._pool_lock = asyncio.Lock()
+            async with self._pool_lock:
+                if self._pool.closed:
+                    await self._pool.open(wait=True)
+        return self._pool.connection()
+
+    async def close(self) -> None:
+        """
+        Closes the connection pool and releases all pooled connections.
+
+        Intended to run once from the application shutdown hook. Safe to
+        call when the pool was never opened.
+        """
+        if not self._pool.closed:
+            await self._pool.close()
 
     async def add_expense(self, expense: Expense) -> int:
         """
@@ -77,13 +173,6 @@ class ExpenseRepository:
             RuntimeError: If the database fails to return an ID after insertion.
             psycopg.Error: If database connection or query execution fails.
         """
-        sql = """
-            INSERT INTO public.expenses
-                (expense_ts, amount, description, method, tag, category, installments)
-            VALUES
-                (NOW(), %s, %s, %s, %s, %s, %s)
-            RETURNING id
-        """
         params = (
             expense.amount,
             expense.description,
@@ -92,8 +181,8 @@ class ExpenseRepository:
             expense.category,
             expense.installments,
         )
-        async with await self._get_conn() as conn:
-            cursor = await conn.execute(sql, params)
+        async with await self._acquire() as conn:
+            cursor = await conn.execute(_SQL_INSERT_EXPENSE, params, prepare=True)
             result = await cursor.fetchone()
             if not result:
                 raise RuntimeError("Failed to retrieve ID after expense insertion.")
@@ -106,7 +195,11 @@ class ExpenseRepository:
         Uses a recursive CTE to distribute installment payments across billing cycles.
         The installment distribution logic handles the transition from old billing cycle
         (4th-3rd) to new cycle (17th-16th) that occurred on Oct 4, 2025, with a
-        special 44-day transition period ending Nov 16, 2025.
+        special 44-day transition period ending Nov 16, 2025. The date-range predicate
+        is applied inside the CTE, so only expenses whose installment window can overlap
+        the period are expanded and the recursion stops once it steps past the end date.
+        Date filters compare Brazil local dates (America/Sao_Paulo), matching the
+        backend SQL, so cycle boundaries do not depend on the session timezone.
 
         Args:
             start_dt: Start date of the period (inclusive).
@@ -119,49 +212,9 @@ class ExpenseRepository:
         Raises:
             psycopg.Error: If database connection or query execution fails.
         """
-        sql = """
-            WITH RECURSIVE installment_cycles AS (
-                SELECT
-                    id,
-                    expense_ts,
-                    amount / installments AS installment_amount,
-                    installments,
-                    1 AS installment_number,
-                    expense_ts AS current_ts
-                FROM public.expenses
-                WHERE installments > 1
-
-                UNION ALL
-
-                SELECT
-                    ic.id,
-                    ic.expense_ts,
-                    ic.installment_amount,
-                    ic.installments,
-                    ic.installment_number + 1,
-                    CASE
-                        WHEN ic.current_ts::date >= DATE '2025-10-04' AND ic.current_ts::date < DATE '2025-11-17'
-                        THEN DATE '2025-11-17' + (ic.current_ts::time)
-                        ELSE ic.current_ts + INTERVAL '1 month'
-                    END
-                FROM installment_cycles ic
-                WHERE ic.installment_number < ic.installments
-            ),
-            monthly_expenses AS (
-                SELECT current_ts AS expense_ts, installment_amount AS amount
-                FROM installment_cycles
-
-                UNION ALL
-
-                SELECT expense_ts, amount
-                FROM public.expenses
-                WHERE installments IS NULL OR installments <= 1
-            )
-            SELECT COALESCE(SUM(amount), 0) FROM monthly_expenses
-            WHERE expense_ts::date BETWEEN %s AND %s
-        """
-        async with await self._get_conn() as conn:
-            cursor = await conn.execute(sql, (start_dt, end_dt))
+        async with await self._acquire() as conn:
+            params = (end_dt, start_dt, end_dt, start_dt, end_dt, start_dt, end_dt)
+            cursor = await conn.execute(_SQL_TOTAL_PERIOD, params, prepare=True)
             row = await cursor.fetchone()
 
         total = row[0] if row and row[0] is not None else Decimal("0")
@@ -180,13 +233,8 @@ class ExpenseRepository:
         Raises:
             psycopg.Error: If database connection or query execution fails.
         """
-        sql = """
-            DELETE FROM public.expenses
-            WHERE id = (SELECT id FROM public.expenses ORDER BY id DESC LIMIT 1)
-            RETURNING id
-        """
-        async with await self._get_conn() as conn:
-            cursor = await conn.execute(sql)
+        async with await self._acquire() as conn:
+            cursor = await conn.execute(_SQL_DELETE_LAST)
             row = await cursor.fetchone()
         return row[0] if row else None
 
@@ -201,7 +249,7 @@ class ExpenseRepository:
             True if connection successful, False if connection fails.
         """
         try:
-            async with await self._get_conn() as conn:
+            async with await self._acquire() as conn:
                 await conn.execute("SELECT 1")
             return True
         except psycopg.Error:
@@ -224,26 +272,21 @@ class ExpenseRepository:
         Raises:
             psycopg.Error: If database connection or query execution fails.
         """
-        sql = """
-            SELECT id, expense_ts, amount, description, method, tag, category, installments
-            FROM public.expenses
-            ORDER BY id DESC
-            LIMIT %s
-        """
-        expenses = []
-        async with await self._get_conn() as conn:
-            cursor = await conn.execute(sql, (limit,))
+        async with await self._acquire() as conn:
+            cursor = await conn.execute(
+                _SQL_LAST_N, (limit,), prepare=True, binary=True
+            )
             rows = await cursor.fetchall()
-            for row in rows:
-                exp = Expense(
-                    amount=row[2],
-                    description=row[3],
-                    method=row[4],
-                    tag=row[5],
-                    category=row[6],
-                    installments=row[7],
-                )
-                exp.id = row[0]
-                exp.expense_ts = row[1]
-                expenses.append(exp)
-        return expenses
+        return [
+            Expense(
+                amount=row[2],
+                description=row[3],
+                method=row[4],
+                tag=row[5],
+                category=row[6],
+                installments=row[7],
+                id=row[0],
+                expense_ts=row[1],
+            )
+            for row in rows
+        ]